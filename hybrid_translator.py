@@ -9,31 +9,68 @@ Bu sistem aşağıdaki özellikler ile gelişmiş çeviri sağlar:
 4. Çoklu model desteği
 """
 
+import contextlib
+import hashlib
 import json
+import orjson
+import queue
 import re
+import sys
+import threading
 import torch
 import os
 import glob
 import difflib
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Callable, Dict, List, Tuple, Any, Optional
+
+# HTML etiketi deseni (modül yüklenirken bir kez derlenir)
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+@functools.lru_cache(maxsize=None)
+def load_terminology_file(file_path: str) -> dict:
+    """Terminoloji sözlüğünü yükle - her dosya yalnızca bir kez okunur"""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print(f"Terminoloji dosyası bulunamadı: {file_path}")
+        return {}
+
+def compile_replacements(replacements: Dict[str, str], word_boundary: bool = False) -> Callable[[str], str]:
+    """Yanlış -> doğru eşlemelerini tek geçişte uygulayan bir fonksiyon derle"""
+    # Aynı terimin farklı yazımlarından ilki geçerli olur
+    unique = {}
+    for wrong, correct in replacements.items():
+        unique.setdefault(wrong.lower(), (wrong, correct))
+    
+    if not unique:
+        return lambda text: text
+    
+    # Uzun terimler önce denenir ki kısa terimler onları bölmesin
+    ordered = sorted(unique.values(), key=lambda pair: len(pair[0]), reverse=True)
+    pattern = '|'.join('(' + re.escape(wrong) + ')' for wrong, _ in ordered)
+    if word_boundary:
+        pattern = r'\b(?:' + pattern + r')\b'
+    
+    regex = re.compile(pattern, re.IGNORECASE)
+    corrections = [correct for _, correct in ordered]
+    return lambda text: regex.sub(lambda m: corrections[m.lastindex - 1], text)
 
 class QualityChecker:
     """Çeviri kalitesi kontrol sistemi"""
     
-    def __init__(self, terminology_file: str = "terminology_dict.json"):
-        self.terminology = self.load_terminology(terminology_file)
+    def __init__(self, terminology_file: str = "terminology_dict.json", terminology: Optional[dict] = None):
+        self.terminology = terminology if terminology is not None else self.load_terminology(terminology_file)
         self.quality_patterns = self.terminology.get("quality_patterns", {})
         
     def load_terminology(self, file_path: str) -> dict:
         """Terminoloji sözlüğünü yükle"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            print(f"Terminoloji dosyası bulunamadı: {file_path}")
-            return {}
+        return load_terminology_file(file_path)
     
     def check_common_mistakes(self, text: str, target_lang: str) -> List[Dict]:
         """Yaygın hataları kontrol et"""
@@ -75,8 +112,8 @@ class QualityChecker:
             issues.append({"type": "too_short", "confidence": 0.7})
         
         # HTML etiket tutarlılığı
-        orig_tags = set(re.findall(r'<[^>]+>', original))
-        trans_tags = set(re.findall(r'<[^>]+>', translated))
+        orig_tags = set(HTML_TAG_RE.findall(original))
+        trans_tags = set(HTML_TAG_RE.findall(translated))
         if orig_tags != trans_tags:
             score -= 10
             issues.append({"type": "html_mismatch", "confidence": 0.8})
@@ -90,28 +127,31 @@ class QualityChecker:
 class TerminologyTranslator:
     """Terminoloji sözlüğü tabanlı çeviri sistemi"""
     
-    def __init__(self, terminology_file: str = "terminology_dict.json"):
-        self.terminology = self.load_terminology(terminology_file)
+    # Kelimeden ayıklanacak noktalama işaretleri
+    _PUNCTUATION_RE = re.compile(r'[^\w\s]')
+    
+    def __init__(self, terminology_file: str = "terminology_dict.json", terminology: Optional[dict] = None):
+        self.terminology = terminology if terminology is not None else self.load_terminology(terminology_file)
+        
+        # Dil çifti -> terminoloji tablosu; her kelimede string karşılaştırması yapılmaz
+        terms = self.terminology.get("admin_ui_terms", {})
+        self._dir_map = {
+            ("turkish", "english"): terms.get("turkish_to_english", {}),
+            ("english", "german"): terms.get("english_to_german", {})
+        }
         
     def load_terminology(self, file_path: str) -> dict:
         """Terminoloji sözlüğünü yükle"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            print(f"Terminoloji dosyası bulunamadı: {file_path}")
-            return {}
+        return load_terminology_file(file_path)
+    
+    def get_term_dict(self, source_lang: str, target_lang: str) -> Dict[str, str]:
+        """Dil çifti için terminoloji tablosunu döndür"""
+        return self._dir_map.get((source_lang, target_lang), {})
     
     def get_term_translation(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
         """Terminoloji sözlüğünden çeviri bul"""
-        terms = self.terminology.get("admin_ui_terms", {})
-        
-        if source_lang == "turkish" and target_lang == "english":
-            return terms.get("turkish_to_english", {}).get(text.lower())
-        elif source_lang == "english" and target_lang == "german":
-            return terms.get("english_to_german", {}).get(text.lower())
-        
-        return None
+        term_dict = self._dir_map.get((source_lang, target_lang))
+        return term_dict.get(text.lower()) if term_dict else None
     
     def translate_with_terminology(self, text: str, source_lang: str, target_lang: str) -> Tuple[str, bool]:
         """Terminoloji sözlüğü ile çeviri yap"""
@@ -123,12 +163,17 @@ class TerminologyTranslator:
         # Partial match dene (kelime kelime)
         words = text.split()
         if len(words) > 1:
+            # Dil çifti tablosu kelime döngüsünden önce bir kez seçilir
+            term_dict = self.get_term_dict(source_lang, target_lang)
+            if not term_dict:
+                return text, False
+            
             translated_words = []
             has_terminology = False
+            strip_punctuation = self._PUNCTUATION_RE.sub
             
             for word in words:
-                clean_word = re.sub(r'[^\w\s]', '', word).lower()
-                term_trans = self.get_term_translation(clean_word, source_lang, target_lang)
+                term_trans = term_dict.get(strip_punctuation('', word).lower())
                 if term_trans:
                     translated_words.append(term_trans)
                     has_terminology = True
@@ -143,64 +188,66 @@ class TerminologyTranslator:
 class PostProcessor:
     """Post-processing ile çeviri düzeltme sistemi"""
     
-    def __init__(self, terminology_file: str = "terminology_dict.json"):
-        self.terminology_translator = TerminologyTranslator(terminology_file)
-        self.quality_checker = QualityChecker(terminology_file)
+    # Yaygın yanlış çeviriler
+    _COMMON_FIXES = {
+        "introduction": "login",  # Giriş → Introduction yerine Login
+        "exit": "logout",         # Çıkış → Exit yerine Logout  
+        "mercenary kurds": "exchange rates",  # Döviz → Mercenary Kurds yerine Exchange Rates
+        "bayiers": "dealers",     # Bayiler → Bayiers yerine Dealers
+        "varient": "variant",     # Varyant → Varient yerine Variant
+        "copyed": "copied",       # Kopyalandı → Copyed yerine Copied
+        "absorptions": "subscriptions", # Abonelik → Absorptions yerine Subscriptions
+        "resorptionen": "abonnements"   # Almanca düzeltme
+    }
+    
+    # Tüm yaygın düzeltmeler tek desende, kelime sınırları korunarak
+    _apply_common_fixes = staticmethod(compile_replacements(_COMMON_FIXES, word_boundary=True))
+    
+    # Cümle başı deseni
+    _CAPITALIZE_RE = re.compile(r'(^|[.!?]\s+)([a-z])')
+    
+    def __init__(self, terminology_file: str = "terminology_dict.json", terminology: Optional[dict] = None):
+        if terminology is None:
+            terminology = load_terminology_file(terminology_file)
+        
+        self.terminology_translator = TerminologyTranslator(terminology=terminology)
+        self.quality_checker = QualityChecker(terminology=terminology)
+        
+        # Yaygın hataları hedef dile göre tek desende derle
+        common_mistakes = self.quality_checker.quality_patterns.get("common_mistakes", {})
+        self._mistake_fixers = {
+            lang: compile_replacements({
+                wrong_term: correct_term
+                for correct_term, wrong_variants in mistakes.items()
+                for wrong_term in wrong_variants
+            })
+            for lang, mistakes in common_mistakes.items()
+        }
     
     def fix_common_mistakes(self, text: str, target_lang: str) -> str:
         """Yaygın hataları düzelt"""
-        mistakes = self.quality_checker.check_common_mistakes(text, target_lang)
-        
-        for mistake in mistakes:
-            wrong_term = mistake["wrong_term"]
-            correct_term = mistake["correct_term"]
-            
-            # Case-insensitive replace
-            text = re.sub(re.escape(wrong_term), correct_term, text, flags=re.IGNORECASE)
+        fixer = self._mistake_fixers.get(target_lang)
+        if fixer is None:
+            return text
         
-        return text
+        # Case-insensitive replace, tüm terimler için tek geçiş
+        return fixer(text)
     
     def apply_terminology_fixes(self, text: str, source_lang: str, target_lang: str) -> str:
         """Terminoloji sözlüğüne göre düzeltmeler yap"""
-        # Terminoloji sözlüğünden ters çeviri tablosu oluştur
-        reverse_terminology = {}
-        terms = self.terminology_translator.terminology.get("admin_ui_terms", {})
-        
-        if source_lang == "turkish" and target_lang == "english":
-            # Türkçe'den İngilizce'ye çeviri için doğru terimleri al
-            for tr_term, en_term in terms.get("turkish_to_english", {}).items():
-                reverse_terminology[tr_term.lower()] = en_term.lower()
-        elif source_lang == "english" and target_lang == "german":
-            # İngilizce'den Almanca'ya çeviri için doğru terimleri al  
-            for en_term, de_term in terms.get("english_to_german", {}).items():
-                reverse_terminology[en_term.lower()] = de_term.lower()
-        
-        # Yaygın yanlış çevirileri düzelt
-        common_fixes = {
-            "introduction": "login",  # Giriş → Introduction yerine Login
-            "exit": "logout",         # Çıkış → Exit yerine Logout  
-            "mercenary kurds": "exchange rates",  # Döviz → Mercenary Kurds yerine Exchange Rates
-            "bayiers": "dealers",     # Bayiler → Bayiers yerine Dealers
-            "varient": "variant",     # Varyant → Varient yerine Variant
-            "copyed": "copied",       # Kopyalandı → Copyed yerine Copied
-            "absorptions": "subscriptions", # Abonelik → Absorptions yerine Subscriptions
-            "resorptionen": "abonnements"   # Almanca düzeltme
-        }
-        
-        # Yaygın hataları düzelt
-        text_lower = text.lower()
-        for wrong, correct in common_fixes.items():
-            if wrong in text_lower:
-                # Kelime sınırlarını koruyarak değiştir
-                pattern = r'\b' + re.escape(wrong) + r'\b'
-                text = re.sub(pattern, correct, text, flags=re.IGNORECASE)
-        
-        return text
+        # Yaygın hataları kelime sınırlarını koruyarak tek geçişte düzelt
+        return self._apply_common_fixes(text)
     
     def normalize_capitalization(self, text: str) -> str:
         """Büyük/küçük harf düzenle"""
+        # Cümle sonu noktalaması yoksa (çoğu UI etiketi) sadece ilk harf etkilenir
+        if '.' not in text and '!' not in text and '?' not in text:
+            if text and 'a' <= text[0] <= 'z':
+                return text[0].upper() + text[1:]
+            return text
+        
         # Cümle başlarını büyük harfle başlat
-        text = re.sub(r'(^|[.!?]\s+)([a-z])', lambda m: m.group(1) + m.group(2).upper(), text)
+        text = self._CAPITALIZE_RE.sub(lambda m: m.group(1) + m.group(2).upper(), text)
         return text
     
     def process_translation(self, original: str, translated: str, source_lang: str, target_lang: str) -> Dict:
@@ -230,101 +277,480 @@ class PostProcessor:
 class HybridTranslator:
     """Hibrit çeviri sistemi - Terminoloji + Model + Post-processing"""
     
-    def __init__(self):
+    # Çevrilmeden bırakılan metinler: harf içermeyenler, tek başına URL ve renk kodları
+    _LETTER_RE = re.compile(r'[^\W\d_]')
+    _URL_RE = re.compile(r'(https?://|www\.)\S+')
+    _HEX_COLOR_RE = re.compile(r'#(?:[0-9a-fA-F]{3,4}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})')
+    
+    # HTML etiketlerini metin parçalarından ayıran desen
+    _HTML_SPLIT_RE = re.compile(r'(<[^>]*>)')
+    
+    # Çeviri belleği biçimi; model çıktısını etkileyen kod değişikliklerinde artırılır
+    _CACHE_FORMAT_VERSION = 2
+    
+    def __init__(self, batch_size: int = 32, cache_file: Optional[str] = "translation_cache.json",
+                 compile_models: bool = False, num_beams: int = 1):
         print("Hibrit Çeviri Sistemi Başlatılıyor...")
         
         # Cihaz ayarı
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         print(f"Kullanılan cihaz: {self.device}")
         
-        # Alt sistemleri başlat
-        self.terminology_translator = TerminologyTranslator()
-        self.post_processor = PostProcessor()
-        self.quality_checker = QualityChecker()
+        # CPU -> GPU kopyaları için iş parçacığına özel stream; stream_context içinde açılır
+        self._streams = threading.local()
+        
+        # Modele tek seferde gönderilecek metin sayısı
+        self.batch_size = batch_size
+        
+        # GPU'da decoder adımlarını torch.compile ile derle (ilk çağrılarda derleme süresi eklenir)
+        self.compile_models = compile_models
+        
+        # Beam sayısı; 1 = greedy decoding (model varsayılanı 4 beam'dir)
+        self.num_beams = num_beams
+        
+        # Çeviri belleği: (kaynak dil, hedef dil, metin) -> ham model çevirisi
+        # Post-processing her kullanımda yeniden uygulanır
+        self.cache_file = cache_file
+        self._tcache: Dict[Tuple[str, str, str], str] = {}
+        
+        # Alt sistemleri başlat; terminoloji dosyası bir kez okunup paylaşılır
+        terminology = load_terminology_file("terminology_dict.json")
+        self.terminology_translator = TerminologyTranslator(terminology=terminology)
+        self.post_processor = PostProcessor(terminology=terminology)
+        self.quality_checker = QualityChecker(terminology=terminology)
         
         # Modelleri yükle
         self.load_models()
+        
+        # Önceki çalıştırmalardan kalan çeviri belleğini yükle
+        self.load_cache()
+    
+    def cache_signature(self) -> str:
+        """Çeviri belleğinin geçerli olduğu model ve çalışma ortamı imzası"""
+        payload = json.dumps({
+            "format": self._CACHE_FORMAT_VERSION,
+            "models": [self.tr_en_model_name, self.en_de_model_name],
+            "dtype": str(self.dtype),
+            "quantized": self.quantized,
+            "num_beams": self.num_beams
+        }, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+    
+    def load_cache(self):
+        """Çeviri belleğini diskten yükle"""
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return
+        
+        try:
+            with open(self.cache_file, "rb") as f:
+                cache_data = orjson.loads(f.read())
+        except Exception as e:
+            print(f"Çeviri belleği okunamadı: {e}")
+            return
+        
+        # Model veya çalışma ortamı değiştiyse eski çeviriler kullanılmaz
+        if not isinstance(cache_data, dict) or cache_data.get("signature") != self.cache_signature():
+            print("Çeviri belleği güncel değil, yeniden oluşturulacak")
+            return
+        
+        try:
+            loaded = {}
+            for source_lang, targets in cache_data.get("entries", {}).items():
+                for target_lang, entries in targets.items():
+                    for text, raw_translation in entries.items():
+                        if not isinstance(raw_translation, str):
+                            raise ValueError(f"geçersiz kayıt: {text!r}")
+                        loaded[(source_lang, target_lang, self.intern_text(text))] = raw_translation
+        except Exception as e:
+            print(f"Çeviri belleği okunamadı: {e}")
+            return
+        
+        self._tcache.update(loaded)
+        print(f"Çeviri belleği yüklendi: {len(self._tcache)} kayıt")
+    
+    def save_cache(self):
+        """Çeviri belleğini diske kaydet"""
+        if not self.cache_file:
+            return
+        
+        entries = {}
+        for (source_lang, target_lang, text), raw_translation in self._tcache.items():
+            entries.setdefault(source_lang, {}).setdefault(target_lang, {})[text] = raw_translation
+        
+        with open(self.cache_file, "wb") as f:
+            f.write(orjson.dumps({"signature": self.cache_signature(), "entries": entries}, option=orjson.OPT_INDENT_2))
     
     def load_models(self):
         """Çeviri modellerini yükle"""
         print("AI Modelleri yükleniyor...")
         
+        # GPU'da yarım hassasiyet (FP16) kullan, CPU'da FP32 kalır
+        self.dtype = torch.float16 if self.device.type == "cuda" else torch.float32
+        self.quantized = False
+        
         # Türkçe -> İngilizce modeli
         print("  Türkçe->İngilizce modeli yükleniyor...")
         self.tr_en_model_name = "Helsinki-NLP/opus-mt-tr-en"
         self.tr_en_tokenizer = AutoTokenizer.from_pretrained(self.tr_en_model_name)
-        self.tr_en_model = AutoModelForSeq2SeqLM.from_pretrained(self.tr_en_model_name).to(self.device)
+        self.tr_en_model = AutoModelForSeq2SeqLM.from_pretrained(
+            self.tr_en_model_name, torch_dtype=self.dtype
+        ).to(self.device)
         
         # İngilizce -> Almanca modeli
         print("  İngilizce->Almanca modeli yükleniyor...")
         self.en_de_model_name = "Helsinki-NLP/opus-mt-en-de"
         self.en_de_tokenizer = AutoTokenizer.from_pretrained(self.en_de_model_name)
-        self.en_de_model = AutoModelForSeq2SeqLM.from_pretrained(self.en_de_model_name).to(self.device)
+        self.en_de_model = AutoModelForSeq2SeqLM.from_pretrained(
+            self.en_de_model_name, torch_dtype=self.dtype
+        ).to(self.device)
+        
+        # CPU'da Linear katmanları INT8 ile çalıştır
+        if self.device.type == "cpu":
+            print("  Modeller CPU için INT8'e kuantize ediliyor...")
+            self.tr_en_model = self.quantize_for_cpu(self.tr_en_model)
+            self.en_de_model = self.quantize_for_cpu(self.en_de_model)
+        
+        # Statik KV-cache ile generate, decoder adımlarını torch.compile
+        # (CUDA graph'ları) ile çalıştırır; prefill adımı eager kalır
+        self._generate_locks = {}
+        if self.compile_models and self.device.type == "cuda":
+            print("  Decoder adımları torch.compile ile derlenecek...")
+            for model in (self.tr_en_model, self.en_de_model):
+                model.generation_config.cache_implementation = "static"
+                # Statik cache model nesnesinde tutulur ve her generate başında sıfırlanır;
+                # aynı modelde eşzamanlı generate çağrıları birbirinin cache'ini bozar
+                self._generate_locks[id(model)] = threading.Lock()
         
         print("Tüm sistemler hazır!")
     
-    def translate_text_hybrid(self, text: str, source_lang: str, target_lang: str, tokenizer, model) -> Dict:
-        """Hibrit çeviri - Model + Terminoloji Post-processing"""
+    def quantize_for_cpu(self, model):
+        """Modelin Linear katmanlarını dinamik INT8 kuantizasyon ile dönüştür"""
+        # x86'da VNNI int8 GEMM çekirdeklerini kullanan bir backend seç
+        if torch.backends.quantized.engine == "none":
+            supported = torch.backends.quantized.supported_engines
+            engine = next((e for e in ("x86", "fbgemm", "onednn", "qnnpack") if e in supported), None)
+            if engine is None:
+                print("  Kuantizasyon backend'i bulunamadı, FP32 ile devam ediliyor")
+                return model
+            torch.backends.quantized.engine = engine
+        
+        self.quantized = True
+        return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    
+    def generate_batch(self, texts: List[str], tokenizer, model) -> List[str]:
+        """Metin listesini batch'ler halinde modelden geçir"""
+        if not texts:
+            return []
+        
+        # Metinleri bir kez tokenize et ve token uzunluğuna göre sırala;
+        # benzer uzunluktaki metinler aynı batch'e düşer, padding israfı azalır
+        encodings = tokenizer(texts, truncation=True)
+        input_ids = encodings["input_ids"]
+        attention_mask = encodings["attention_mask"]
+        order = sorted(range(len(texts)), key=lambda i: len(input_ids[i]))
+        batches = [order[start:start + self.batch_size] for start in range(0, len(order), self.batch_size)]
+        translations = [None] * len(texts)
+        
+        def prepare(indices):
+            return self.to_device(tokenizer.pad(
+                {
+                    "input_ids": [input_ids[i] for i in indices],
+                    "attention_mask": [attention_mask[i] for i in indices]
+                },
+                padding="longest",
+                # Derleme modunda uzunluklar 64'ün katlarına yuvarlanır; statik cache
+                # ve derlenmiş graph az sayıda farklı boyutla yeniden kullanılır
+                pad_to_multiple_of=64 if self._generate_locks else None,
+                return_tensors="pt"
+            ))
+        
+        # Çıkarımda autograd kaydı tutulmaz
+        with torch.inference_mode():
+            next_inputs = prepare(batches[0])
+            for n, indices in enumerate(batches):
+                inputs = self.wait_for_inputs(next_inputs)
+                
+                # Sonraki batch'in kopyası bu batch çevrilirken başlar
+                if n + 1 < len(batches):
+                    next_inputs = prepare(batches[n + 1])
+                
+                # Kısa UI metinleri için 512 adımlık sabit sınır yerine girdi uzunluğuna göre sınır
+                input_len = inputs["input_ids"].shape[1]
+                with self._generate_locks.get(id(model), contextlib.nullcontext()):
+                    outputs = model.generate(
+                        **inputs,
+                        max_new_tokens=min(512, int(input_len * 1.8) + 8),
+                        num_beams=self.num_beams,
+                        do_sample=False,
+                        use_cache=True
+                    )
+                
+                # Sonuçları orijinal sıraya geri yerleştir
+                for i, translated in zip(indices, tokenizer.batch_decode(outputs, skip_special_tokens=True)):
+                    translations[i] = translated.strip()
+        
+        return translations
+    
+    def copy_stream(self):
+        """Bu iş parçacığının kopyalama stream'ini döndür (yoksa None)"""
+        return getattr(self._streams, "copy", None)
+    
+    def to_device(self, inputs) -> Dict:
+        """Tokenize edilmiş girdileri cihaza taşı"""
+        copy_stream = self.copy_stream()
+        if copy_stream is None:
+            return inputs.to(self.device)
+        
+        # Sabitlenmiş (pinned) bellekten bloklamayan kopya, ayrı stream üzerinde
+        with torch.cuda.stream(copy_stream):
+            return {k: v.pin_memory().to(self.device, non_blocking=True) for k, v in inputs.items()}
+    
+    def wait_for_inputs(self, inputs) -> Dict:
+        """Kopyalama stream'indeki aktarımların bitmesini hesaplama stream'inde bekle"""
+        copy_stream = self.copy_stream()
+        if copy_stream is None:
+            return inputs
+        
+        current_stream = torch.cuda.current_stream(self.device)
+        current_stream.wait_stream(copy_stream)
+        for tensor in inputs.values():
+            # Bellek, hesaplama stream'i kullanırken yeniden tahsis edilmesin
+            tensor.record_stream(current_stream)
+        return inputs
+    
+    def split_html_parts(self, text: str) -> Tuple[List[str], List[int]]:
+        """HTML etiketlerini ayır, çevrilecek parçaların indekslerini döndür"""
+        parts = [part for part in self._HTML_SPLIT_RE.split(text) if part]
+        slots = [
+            i for i, part in enumerate(parts)
+            if not (part.startswith('<') and part.endswith('>')) and part.strip()
+        ]
+        return parts, slots
+    
+    def join_html_parts(self, parts: List[str], slots: List[int], translations: Dict[str, str]) -> str:
+        """Çevrilen parçaları HTML etiketleriyle birleştir"""
+        parts = list(parts)
         
-        # HTML etiketlerini koru
+        for i in slots:
+            part = parts[i]
+            translated = translations[part.strip()]
+            
+            if part.startswith(' '):
+                translated = ' ' + translated
+            if part.endswith(' '):
+                translated = translated + ' '
+            
+            parts[i] = translated
+        
+        return ''.join(parts)
+    
+    def is_translatable(self, text: str) -> bool:
+        """Metnin modele gönderilmeye değer olup olmadığını kontrol et"""
+        # HTML etiketlerinin içi çevrilmez, sadece aradaki metne bakılır
         if '<' in text:
-            model_translation = self.translate_text_with_html(text, tokenizer, model)
-        else:
-            inputs = tokenizer(text, return_tensors="pt", truncation=True).to(self.device)
-            outputs = model.generate(**inputs, max_length=512)
-            model_translation = tokenizer.decode(outputs[0], skip_special_tokens=True).strip()
+            text = HTML_TAG_RE.sub('', text)
+        
+        stripped = text.strip()
+        if not stripped or not self._LETTER_RE.search(stripped):
+            return False
+        
+        return not (self._URL_RE.fullmatch(stripped) or self._HEX_COLOR_RE.fullmatch(stripped))
+    
+    def intern_text(self, text: str) -> str:
+        """Kısa metinleri tek bir paylaşılan nesneye indir"""
+        # "Kaydet", "Çıkış" gibi tekrar eden etiketlerin çevirileri
+        # ağaçta ve bellekte aynı string nesnesini paylaşır
+        return sys.intern(text) if len(text) < 64 else text
+    
+    def passthrough_result(self, text: str) -> Dict:
+        """Çevrilmeden bırakılan metin için sonuç oluştur"""
+        return {
+            "original": text,
+            "raw_translation": text,
+            "processed_translation": text,
+            "quality": {"score": 100.0, "issues": [], "needs_review": False},
+            "improved": False,
+            "method": "passthrough"
+        }
+    
+    def translate_texts_hybrid(self, texts: List[str], source_lang: str, target_lang: str, tokenizer, model) -> List[Dict]:
+        """Metin listesini hibrit sistem ile çevir - model çağrıları batch halinde yapılır"""
+        # Sayı, URL, renk kodu gibi çevrilemeyen metinler modele gönderilmez
+        translatable = {text: self.is_translatable(text) for text in texts}
+        
+        # Çeviri belleğinde olmayan tekil metinleri bul
+        pending = [
+            text for text, should_translate in translatable.items()
+            if should_translate and (source_lang, target_lang, text) not in self._tcache
+        ]
+        
+        # Çevrilecek tüm segmentleri topla (HTML içeren metinler parçalanır)
+        layouts = []
+        segments = {}
+        
+        for text in pending:
+            if '<' in text:
+                parts, slots = self.split_html_parts(text)
+                for i in slots:
+                    segments.setdefault(parts[i].strip())
+                layouts.append((parts, slots))
+            else:
+                segments.setdefault(text)
+                layouts.append(None)
+        
+        # Tekil segmentleri tek seferde modelden geçir
+        unique_segments = list(segments)
+        translations = dict(zip(unique_segments, self.generate_batch(unique_segments, tokenizer, model)))
         
-        # Post-processing ile terminoloji düzeltmeleri yap
-        result = self.post_processor.process_translation(text, model_translation, source_lang, target_lang)
-        result["method"] = "model+terminology_postprocess"
+        for text, layout in zip(pending, layouts):
+            if layout is None:
+                model_translation = translations[text]
+            else:
+                model_translation = self.join_html_parts(*layout, translations)
+            
+            self._tcache[(source_lang, target_lang, self.intern_text(text))] = model_translation
         
-        return result
+        results = []
+        for text in texts:
+            if not translatable[text]:
+                results.append(self.passthrough_result(text))
+                continue
+            
+            # Post-processing ile terminoloji düzeltmeleri yap; her çağrı yeni bir sonuç üretir
+            model_translation = self._tcache[(source_lang, target_lang, text)]
+            result = self.post_processor.process_translation(text, model_translation, source_lang, target_lang)
+            result["method"] = "model+terminology_postprocess"
+            result["processed_translation"] = self.intern_text(result["processed_translation"])
+            results.append(result)
+        
+        return results
+    
+    def translate_text_hybrid(self, text: str, source_lang: str, target_lang: str, tokenizer, model) -> Dict:
+        """Hibrit çeviri - Model + Terminoloji Post-processing"""
+        return self.translate_texts_hybrid([text], source_lang, target_lang, tokenizer, model)[0]
     
     def translate_text_with_html(self, text, tokenizer, model):
         """HTML etiketlerini koruyarak metni çevir"""
         if '<' not in text:
-            inputs = tokenizer(text, return_tensors="pt", truncation=True).to(self.device)
-            outputs = model.generate(**inputs, max_length=512)
-            return tokenizer.decode(outputs[0], skip_special_tokens=True).strip()
+            return self.generate_batch([text], tokenizer, model)[0]
 
-        # HTML etiketleri ve metinleri ayır
-        parts = re.split(r'(<[^>]*>)', text)
-        translated_parts = []
+        # HTML etiketleri ve metinleri ayır, metin parçalarını tek batch'te çevir
+        parts, slots = self.split_html_parts(text)
+        segments = list(dict.fromkeys(parts[i].strip() for i in slots))
+        translations = dict(zip(segments, self.generate_batch(segments, tokenizer, model)))
 
-        for part in parts:
-            if not part:
-                continue
-            elif part.startswith('<') and part.endswith('>'):
-                translated_parts.append(part)
+        return self.join_html_parts(parts, slots, translations)
+    
+    def iter_strings(self, data):
+        """JSON ağacındaki string yaprakları belge sırasıyla, özyineleme olmadan üret"""
+        stack = deque([data])
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                stack.extend(reversed(list(node.values())))
+            elif isinstance(node, list):
+                stack.extend(reversed(node))
+            elif isinstance(node, str):
+                yield node
+    
+    def build_translated_tree(self, data, translations: Dict[str, str]):
+        """Ağacı tek geçişte kopyala, string yaprakları çevirileriyle değiştir"""
+        root = [None]
+        stack = deque([(data, root, 0)])
+        while stack:
+            node, parent, key = stack.pop()
+            if isinstance(node, dict):
+                clone = dict.fromkeys(node)
+                stack.extend((value, clone, k) for k, value in node.items())
+            elif isinstance(node, list):
+                clone = [None] * len(node)
+                stack.extend((value, clone, i) for i, value in enumerate(node))
+            elif isinstance(node, str):
+                clone = translations[node]
             else:
-                clean_text = part.strip()
-                if clean_text:
-                    inputs = tokenizer(clean_text, return_tensors="pt", truncation=True).to(self.device)
-                    outputs = model.generate(**inputs, max_length=512)
-                    translated = tokenizer.decode(outputs[0], skip_special_tokens=True).strip()
-
-                    if part.startswith(' '):
-                        translated = ' ' + translated
-                    if part.endswith(' '):
-                        translated = translated + ' '
-
-                    translated_parts.append(translated)
-                else:
-                    translated_parts.append(part)
-
-        return ''.join(translated_parts)
+                clone = node
+            parent[key] = clone
+        
+        return root[0]
     
     def translate_json_hybrid(self, data, source_lang: str, target_lang: str, tokenizer, model):
         """JSON'u hibrit sistem ile çevir"""
-        if isinstance(data, dict):
-            return {k: self.translate_json_hybrid(v, source_lang, target_lang, tokenizer, model) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [self.translate_json_hybrid(i, source_lang, target_lang, tokenizer, model) for i in data]
-        elif isinstance(data, str):
-            result = self.translate_text_hybrid(data, source_lang, target_lang, tokenizer, model)
-            return result["processed_translation"]
-        else:
-            return data
+        # 1. geçiş: tüm tekil string yaprakları topla
+        unique_texts = list(dict.fromkeys(self.iter_strings(data)))
+        
+        # 2. geçiş: tekil metinleri batch halinde çevir
+        results = self.translate_texts_hybrid(unique_texts, source_lang, target_lang, tokenizer, model)
+        translations = {text: result["processed_translation"] for text, result in zip(unique_texts, results)}
+        
+        return self.build_translated_tree(data, translations)
+    
+    @contextlib.contextmanager
+    def stream_context(self):
+        """CUDA'da iş parçacığına ait hesaplama ve kopyalama stream'leri aç, CPU'da bir şey yapma"""
+        if self.device.type != "cuda":
+            yield
+            return
+        
+        previous = self.copy_stream()
+        self._streams.copy = torch.cuda.Stream(device=self.device)
+        try:
+            with torch.cuda.stream(torch.cuda.Stream(device=self.device)):
+                yield
+        finally:
+            self._streams.copy = previous
+    
+    def translate_pipeline(self, texts: List[str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Türkçe -> İngilizce -> Almanca zincirini üretici/tüketici pipeline ile çalıştır"""
+        english = {}
+        german = {}
+        chunks = queue.Queue()
+        errors = []
+        
+        # Metinler uzunluğa göre sıralanıp birkaç batch'lik pencerelere bölünür;
+        # böylece benzer uzunluktaki metinler aynı batch'e düşer ve padding azalır
+        ordered = sorted(texts, key=len)
+        window = self.batch_size * 4
+        
+        # Üretici: Türkçe -> İngilizce batch'lerini kuyruğa koyar
+        def produce():
+            try:
+                with self.stream_context():
+                    for start in range(0, len(ordered), window):
+                        chunk = ordered[start:start + window]
+                        results = self.translate_texts_hybrid(
+                            chunk, "turkish", "english",
+                            self.tr_en_tokenizer, self.tr_en_model
+                        )
+                        chunks.put([(text, result["processed_translation"]) for text, result in zip(chunk, results)])
+            except BaseException as e:
+                errors.append(e)
+            finally:
+                chunks.put(None)
+        
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        
+        # Tüketici: tamamlanan batch'leri İngilizce -> Almanca çevirir
+        with self.stream_context():
+            while True:
+                chunk = chunks.get()
+                if chunk is None:
+                    break
+                
+                english_texts = [translation for _, translation in chunk]
+                results = self.translate_texts_hybrid(
+                    english_texts, "english", "german",
+                    self.en_de_tokenizer, self.en_de_model
+                )
+                for (text, translation), result in zip(chunk, results):
+                    english[text] = translation
+                    german[text] = result["processed_translation"]
+        
+        producer.join()
+        if errors:
+            raise errors[0]
+        
+        return english, german
     
     def translate_file_hybrid(self, input_file: str, base_directory: str = "."):
         """Dosyayı hibrit sistem ile çevir"""
@@ -341,43 +767,36 @@ class HybridTranslator:
         
         # JSON dosyasını oku
         try:
-            with open(input_file, "r", encoding="utf-8") as f:
-                original_data = json.load(f)
+            with open(input_file, "rb") as f:
+                original_data = orjson.loads(f.read())
         except Exception as e:
             print(f"Dosya okuma hatası: {e}")
             return
         
-        # 1. Türkçe -> İngilizce çeviri
-        print("  Türkçe -> İngilizce çeviri...")
+        # Türkçe -> İngilizce -> Almanca çeviri; iki aşama eşzamanlı çalışır
+        print(f"  {base_name}: Türkçe -> İngilizce -> Almanca çeviri...")
+        
+        unique_texts = list(dict.fromkeys(self.iter_strings(original_data)))
+        english, german = self.translate_pipeline(unique_texts)
         
-        english_data = self.translate_json_hybrid(
-            original_data, "turkish", "english", 
-            self.tr_en_tokenizer, self.tr_en_model
-        )
+        english_data = self.build_translated_tree(original_data, english)
+        german_data = self.build_translated_tree(original_data, german)
         
         # İngilizce çeviriyi kaydet
         english_file = os.path.join(en_folder, f"{base_name}.json")
-        with open(english_file, "w", encoding="utf-8") as f:
-            json.dump(english_data, f, ensure_ascii=False, indent=2)
-        
-        print(f"  İngilizce çeviri tamamlandı")
+        with open(english_file, "wb") as f:
+            f.write(orjson.dumps(english_data, option=orjson.OPT_INDENT_2))
         
-        # 2. İngilizce -> Almanca çeviri
-        print("  İngilizce -> Almanca çeviri...")
-        
-        german_data = self.translate_json_hybrid(
-            english_data, "english", "german",
-            self.en_de_tokenizer, self.en_de_model
-        )
+        print(f"  {base_name}: İngilizce çeviri tamamlandı")
         
         # Almanca çeviriyi kaydet
         german_file = os.path.join(de_folder, f"{base_name}.json")
-        with open(german_file, "w", encoding="utf-8") as f:
-            json.dump(german_data, f, ensure_ascii=False, indent=2)
+        with open(german_file, "wb") as f:
+            f.write(orjson.dumps(german_data, option=orjson.OPT_INDENT_2))
         
-        print(f"  Almanca çeviri tamamlandı")
+        print(f"  {base_name}: Almanca çeviri tamamlandı")
     
-    def run_hybrid(self, base_directory: str = "."):
+    def run_hybrid(self, base_directory: str = ".", max_workers: Optional[int] = None):
         """Hibrit çeviri sistemini çalıştır"""
         print(f"\n{base_directory}/tr_jsons_hybrid klasöründe JSON dosyaları aranıyor...")
         
@@ -394,9 +813,19 @@ class HybridTranslator:
         
         print(f"Bulunan dosyalar: {len(tr_files)}")
         
-        # Her dosyayı çevir
-        for file in tr_files:
-            self.translate_file_hybrid(file, base_directory)
+        # CPU'da her generate çağrısı kendi intra-op thread havuzunu kullanır;
+        # paralel dosyalar çekirdekleri aşırı yükler, bu yüzden varsayılan tek dosyadır
+        if max_workers is None:
+            max_workers = 4 if self.device.type == "cuda" else 1
+        
+        # Dosyaları paralel çevir; modeller iş parçacıkları arasında paylaşılır
+        # (generate sırasında PyTorch GIL'i bırakır, tokenizasyon ve post-processing örtüşür)
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(lambda file: self.translate_file_hybrid(file, base_directory), tr_files))
+        finally:
+            # Bir dosya hata verse bile diğerlerinin çevirileri kaybolmasın
+            self.save_cache()
         
         print(f"\nÇeviri işlemi tamamlandı!")
         print(f"Çıktı klasörleri:")